@@ -412,6 +412,8 @@ mod tests {
             max_concurrent_chunks: None,
             rpc_url: "".to_string(),
             labels: cryo_freeze::SourceLabels::default(),
+            block_receipts_support: cryo_freeze::MethodSupport::default(),
+            batch_receipts_support: cryo_freeze::MethodSupport::default(),
         };
         let source = Arc::new(source);
         for (test, res) in tests {
@@ -474,6 +476,8 @@ mod tests {
             max_concurrent_chunks: Some(1),
             rate_limiter: Arc::new(None),
             labels: cryo_freeze::SourceLabels::default(),
+            block_receipts_support: cryo_freeze::MethodSupport::default(),
+            batch_receipts_support: cryo_freeze::MethodSupport::default(),
         });
         for (test, res) in tests {
             match test {
@@ -547,6 +551,8 @@ mod tests {
             max_concurrent_chunks: Some(1),
             rpc_url: "".to_string(),
             labels: cryo_freeze::SourceLabels::default(),
+            block_receipts_support: cryo_freeze::MethodSupport::default(),
+            batch_receipts_support: cryo_freeze::MethodSupport::default(),
         };
         let source = Arc::new(source);
         for (test, res) in tests {
@@ -71,6 +71,8 @@ pub(crate) async fn parse_source(args: &Args) -> Result<Source, ParseError> {
             max_retries: Some(args.max_retries),
             initial_backoff: Some(args.initial_backoff),
         },
+        block_receipts_support: cryo_freeze::MethodSupport::default(),
+        batch_receipts_support: cryo_freeze::MethodSupport::default(),
     };
 
     Ok(output)
@@ -97,7 +99,7 @@ pub(crate) fn parse_rpc_url(args: &Args) -> Result<String, ParseError> {
         url
     } else {
         let message = "must provide --rpc or setup MESC or set ETH_RPC_URL";
-        return Err(ParseError::ParseError(message.to_string()))
+        return Err(ParseError::ParseError(message.to_string()));
     };
 
     // prepend http or https if need be
@@ -356,6 +356,8 @@ mod tests {
             max_concurrent_chunks: None,
             rpc_url: "".to_string(),
             labels: SourceLabels::default(),
+            block_receipts_support: cryo_freeze::MethodSupport::default(),
+            batch_receipts_support: cryo_freeze::MethodSupport::default(),
         }
     }
 
@@ -1,6 +1,10 @@
-use std::sync::Arc;
+use std::sync::{
+    atomic::{AtomicU8, Ordering},
+    Arc,
+};
 
 use ethers::prelude::*;
+use futures::{stream::FuturesUnordered, StreamExt};
 use governor::{
     clock::DefaultClock,
     middleware::NoOpMiddleware,
@@ -35,6 +39,56 @@ pub struct Source {
     pub rate_limiter: Arc<Option<RateLimiter>>,
     /// Labels (these are non-functional)
     pub labels: SourceLabels,
+    /// cached result of whether node supports eth_getBlockReceipts
+    pub block_receipts_support: MethodSupport,
+    /// cached result of whether node supports JSON-RPC request batching
+    pub batch_receipts_support: MethodSupport,
+}
+
+const METHOD_SUPPORT_UNKNOWN: u8 = 0;
+const METHOD_SUPPORTED: u8 = 1;
+const METHOD_UNSUPPORTED: u8 = 2;
+
+/// shared tri-state flag caching whether node supports an RPC method
+#[derive(Clone, Debug)]
+pub struct MethodSupport(Arc<AtomicU8>);
+
+impl Default for MethodSupport {
+    fn default() -> MethodSupport {
+        MethodSupport(Arc::new(AtomicU8::new(METHOD_SUPPORT_UNKNOWN)))
+    }
+}
+
+impl MethodSupport {
+    /// whether method has been marked unsupported
+    pub fn is_unsupported(&self) -> bool {
+        self.0.load(Ordering::Relaxed) == METHOD_UNSUPPORTED
+    }
+
+    /// record that method succeeded
+    pub fn mark_supported(&self) {
+        self.0.store(METHOD_SUPPORTED, Ordering::Relaxed)
+    }
+
+    /// record that node reported method as unavailable
+    pub fn mark_unsupported(&self) {
+        self.0.store(METHOD_UNSUPPORTED, Ordering::Relaxed)
+    }
+}
+
+/// whether error indicates node does not implement the RPC method (JSON-RPC code -32601)
+fn error_is_method_not_found(error: &CollectError) -> bool {
+    let message = error.to_string();
+    message.contains("-32601") || message.to_lowercase().contains("method not found")
+}
+
+/// whether error indicates node rejected or could not serve a JSON-RPC batch request
+fn error_is_batch_not_supported(error: &CollectError) -> bool {
+    let message = error.to_string();
+    message.contains("could not decode batch response") ||
+        message.contains("batch response missing id") ||
+        message.contains("invalid id in batch response") ||
+        error_is_method_not_found(error)
 }
 
 /// A non-generic wrapper over different provider types for use as a trait object
@@ -87,6 +141,16 @@ macro_rules! source_provider {
     };
 }
 
+/// maximum number of calls per JSON-RPC batch request
+const MAX_RECEIPTS_PER_BATCH: usize = 500;
+
+/// approximate serialized size of one eth_getTransactionReceipt batch entry
+const RECEIPT_CALL_SIZE_HINT: usize = 160;
+
+lazy_static::lazy_static! {
+    static ref BATCH_HTTP_CLIENT: reqwest::Client = reqwest::Client::new();
+}
+
 impl Source {
     /// Returns all receipts for a block.
     /// Tries to use `eth_getBlockReceipts` first, and falls back to `eth_getTransactionReceipt`
@@ -96,8 +160,19 @@ impl Source {
     ) -> Result<Vec<TransactionReceipt>> {
         let block_number =
             block.number.ok_or(CollectError::CollectError("no block number".to_string()))?.as_u64();
-        if let Ok(receipts) = self.get_block_receipts(block_number).await {
-            return Ok(receipts);
+        if !self.block_receipts_support.is_unsupported() {
+            match self.get_block_receipts(block_number).await {
+                Ok(receipts) => {
+                    self.block_receipts_support.mark_supported();
+                    return Ok(receipts);
+                }
+                Err(e) => {
+                    // skip future eth_getBlockReceipts attempts once node reports it missing
+                    if error_is_method_not_found(&e) {
+                        self.block_receipts_support.mark_unsupported();
+                    }
+                }
+            }
         }
 
         self.get_tx_receipts(&block.transactions).await
@@ -108,28 +183,128 @@ impl Source {
         &self,
         transactions: &Vec<Transaction>,
     ) -> Result<Vec<TransactionReceipt>> {
-        let mut tasks = Vec::new();
-        for tx in transactions {
+        if let ProviderWrapper::RetryClientHttp(_) = &self.provider {
+            if !self.batch_receipts_support.is_unsupported() {
+                let tx_hashes: Vec<TxHash> = transactions.iter().map(|tx| tx.hash).collect();
+                match self.batch_get_tx_receipts(&tx_hashes).await {
+                    Ok(receipts) => {
+                        self.batch_receipts_support.mark_supported();
+                        return Ok(receipts);
+                    }
+                    Err(e) => {
+                        // skip future batch attempts once node rejects the batch envelope;
+                        // transient failures fall through to the per-tx path without the mark
+                        if error_is_batch_not_supported(&e) {
+                            self.batch_receipts_support.mark_unsupported();
+                        }
+                    }
+                }
+            }
+        }
+
+        let mut tasks = FuturesUnordered::new();
+        for (index, tx) in transactions.iter().enumerate() {
             let tx_hash = tx.hash;
             let source = self.clone();
-            let task = task::spawn(async move {
-                match source.get_transaction_receipt(tx_hash).await? {
+            tasks.push(task::spawn(async move {
+                let receipt = match source.get_transaction_receipt(tx_hash).await? {
                     Some(receipt) => Ok(receipt),
                     None => {
                         Err(CollectError::CollectError("could not find tx receipt".to_string()))
                     }
-                }
-            });
-            tasks.push(task);
+                };
+                Ok::<_, CollectError>((index, receipt?))
+            }));
         }
-        let mut receipts = Vec::new();
-        for task in tasks {
-            match task.await {
-                Ok(receipt) => receipts.push(receipt?),
+
+        // process results as they arrive, using indices to preserve transaction order
+        let mut receipts: Vec<Option<TransactionReceipt>> = vec![None; transactions.len()];
+        while let Some(task) = tasks.next().await {
+            match task {
+                Ok(result) => {
+                    let (index, receipt): (usize, TransactionReceipt) = result?;
+                    receipts[index] = Some(receipt);
+                }
                 Err(e) => return Err(CollectError::TaskFailed(e)),
             }
         }
 
+        receipts
+            .into_iter()
+            .map(|receipt| {
+                receipt.ok_or(CollectError::CollectError("could not find tx receipt".to_string()))
+            })
+            .collect()
+    }
+
+    /// Returns receipts for transaction hashes by sending all `eth_getTransactionReceipt` calls
+    /// in a single JSON-RPC batch request instead of one HTTP round-trip per transaction.
+    ///
+    /// Batches are posted through a raw shared client, bypassing the RetryClient retry and
+    /// backoff logic: on transient batch failures callers intentionally demote to the
+    /// retrying per-transaction fan-out path instead
+    pub async fn batch_get_tx_receipts(
+        &self,
+        tx_hashes: &[TxHash],
+    ) -> Result<Vec<TransactionReceipt>> {
+        use std::fmt::Write;
+
+        let mut receipts = Vec::with_capacity(tx_hashes.len());
+        for chunk in tx_hashes.chunks(MAX_RECEIPTS_PER_BATCH) {
+            // serialize all envelopes directly into one preallocated buffer
+            let mut body = String::with_capacity(2 + chunk.len() * RECEIPT_CALL_SIZE_HINT);
+            body.push('[');
+            for (id, tx_hash) in chunk.iter().enumerate() {
+                if id > 0 {
+                    body.push(',');
+                }
+                write!(
+                    body,
+                    "{{\"jsonrpc\":\"2.0\",\"method\":\"eth_getTransactionReceipt\",\"params\":[\"{:?}\"],\"id\":{}}}",
+                    tx_hash, id
+                )
+                .map_err(|_| CollectError::RPCError("could not encode batch request".to_string()))?;
+            }
+            body.push(']');
+
+            let _permit = self.permit_request().await;
+            let response = BATCH_HTTP_CLIENT
+                .post(&self.rpc_url)
+                .header("content-type", "application/json")
+                .body(body)
+                .send()
+                .await
+                .map_err(|_| CollectError::RPCError("batch receipt request failed".to_string()))?;
+            let responses: Vec<serde_json::Value> = response.json().await.map_err(|_| {
+                CollectError::RPCError("could not decode batch response".to_string())
+            })?;
+
+            // nodes may return batch entries in any order, so reassemble by id
+            let mut chunk_receipts: Vec<Option<TransactionReceipt>> = vec![None; chunk.len()];
+            for response in responses.into_iter() {
+                let id = response
+                    .get("id")
+                    .and_then(|id| id.as_u64())
+                    .ok_or(CollectError::RPCError("batch response missing id".to_string()))?;
+                let result = response
+                    .get("result")
+                    .filter(|result| !result.is_null())
+                    .ok_or(CollectError::CollectError("could not find tx receipt".to_string()))?;
+                let receipt: TransactionReceipt = serde_json::from_value(result.clone())
+                    .map_err(|_| CollectError::RPCError("could not parse receipt".to_string()))?;
+                *chunk_receipts
+                    .get_mut(id as usize)
+                    .ok_or(CollectError::RPCError("invalid id in batch response".to_string()))? =
+                    Some(receipt);
+            }
+            for receipt in chunk_receipts.into_iter() {
+                receipts.push(
+                    receipt.ok_or(CollectError::CollectError(
+                        "could not find tx receipt".to_string(),
+                    ))?,
+                )
+            }
+        }
         Ok(receipts)
     }
 }
@@ -181,6 +356,8 @@ impl Source {
             },
             rate_limiter: rate_limiter.into(),
             semaphore: semaphore.into(),
+            block_receipts_support: MethodSupport::default(),
+            batch_receipts_support: MethodSupport::default(),
         };
 
         Ok(source)
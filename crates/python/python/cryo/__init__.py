@@ -6,4 +6,8 @@ from ._freeze import async_freeze
 from ._freeze import freeze
 from ._collect import async_collect
 from ._collect import collect
+from ._collect import collect_many
+from ._filesystem import get_file_list
+from ._filesystem import get_glob
+from ._filesystem import scan
 
@@ -15,29 +15,14 @@ def parse_cli_args(
     verbose: bool = True,
     **kwargs: Unpack[_spec.CryoCliArgs],
 ) -> _spec.CryoCliArgs:
-    """
-    TODO: write this part in rust
-    """
+    """parse kwargs into cli args, implemented in rust"""
 
-    if start_block is not None and end_block is not None:
-        kwargs['blocks'] = [str(start_block) + ':' + str(end_block)]
-    elif start_block is not None:
-        kwargs['blocks'] = [str(start_block) + ':']
-    elif end_block is not None:
-        kwargs['blocks'] = [':' + str(end_block)]
-
-    if file_format == 'parquet':
-        pass
-    elif file_format == 'json':
-        kwargs['json'] = True
-    elif file_format == 'csv':
-        kwargs['csv'] = True
-    # elif file_format == 'avro':
-    #     kwargs['avro'] = True
-    else:
-        raise Exception('unknown file_format')
-
-    kwargs['no_verbose'] = not verbose
-
-    return kwargs
+    from . import _cryo_rust  # type: ignore
 
+    return _cryo_rust.parse_cli_args(  # type: ignore
+        start_block=start_block,
+        end_block=end_block,
+        file_format=file_format,
+        verbose=verbose,
+        **kwargs,
+    )
@@ -1,4 +1,5 @@
 from __future__ import annotations
+
 import typing
 
 if typing.TYPE_CHECKING:
@@ -12,57 +13,84 @@ if typing.TYPE_CHECKING:
     ListOfDicts = list[dict[str, Any]]
     DictOfLists = dict[str, list[Any]]
 
+# chunk size used for all collect() calls, single source of truth
+_COLLECT_CHUNK_SIZE = 20_000_000
+
 
 async def async_collect(
     datatype: _spec.Datatype,
     output_format: _spec.PythonOutput = 'polars',
     **kwargs: Unpack[_spec.CryoCliArgs],
-) -> pl.DataFrame | pd.DataFrame | ListOfDicts | DictOfLists:
+) -> pl.DataFrame | pl.Series | pd.DataFrame | pd.Series | ListOfDicts | DictOfLists:
     """asynchronously collect data and return as dataframe"""
 
-    from . import _args
     from . import _cryo_rust  # type: ignore
 
-    # parse inputs
-    cli_args = _args.parse_cli_args(**kwargs)
-
-    # fix chunk size
-    cli_args['chunk_size'] = 20_000_000
-
-    # collect data
+    cli_args = _parse_collect_args(kwargs)
     result: pl.DataFrame = await _cryo_rust._collect(datatype, **cli_args)
-
-    # format output
-    if output_format == 'polars':
-        return result
-    elif output_format == 'pandas':
-        return result.to_pandas()
-    elif output_format == 'list':
-        return result.to_dicts()
-    elif output_format == 'dict':
-        return result.to_dict(as_series=False)
-    else:
-        raise Exception('unknown output format')
+    return _format_output(result, output_format)
 
 
 def collect(
     datatype: _spec.Datatype,
     output_format: _spec.PythonOutput = 'polars',
     **kwargs: Unpack[_spec.CryoCliArgs],
-) -> pl.DataFrame | pd.DataFrame | ListOfDicts | DictOfLists:
+) -> pl.DataFrame | pl.Series | pd.DataFrame | pd.Series | ListOfDicts | DictOfLists:
     """collect data and return as dataframe"""
 
-    import asyncio
+    from . import _cryo_rust  # type: ignore
 
-    coroutine = async_collect(datatype, output_format=output_format, **kwargs)
+    cli_args = _parse_collect_args(kwargs)
+    result: pl.DataFrame = _cryo_rust._collect_blocking(datatype, **cli_args)
+    return _format_output(result, output_format)
 
-    try:
-        import concurrent.futures
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(loop.run_until_complete, coroutine)  # type: ignore
-            return future.result()  # type: ignore
-    except RuntimeError:
-        return asyncio.run(coroutine)
 
+def collect_many(
+    datatype: typing.Sequence[_spec.Datatype],
+    **kwargs: Unpack[_spec.CryoCliArgs],
+) -> dict[str, pl.DataFrame]:
+    """collect multiple datatypes in one pass, sharing one RPC pipeline"""
+
+    from . import _cryo_rust  # type: ignore
+
+    cli_args = _parse_collect_args(kwargs)
+    return _cryo_rust._collect_many_blocking(list(datatype), **cli_args)  # type: ignore
+
+
+def _parse_collect_args(kwargs: _spec.CryoCliArgs) -> _spec.CryoCliArgs:
+    """parse collect kwargs shared by the sync and async entry points"""
+
+    from . import _args
+
+    cli_args = _args.parse_cli_args(**kwargs)
+    cli_args['chunk_size'] = _COLLECT_CHUNK_SIZE
+    return cli_args
+
+
+def _to_pandas(result: pl.DataFrame) -> pd.DataFrame | pd.Series:
+    if len(result.columns) == 1:
+        # skip full-frame conversion when there is only one column
+        return result.to_series().to_pandas()
+    return result.to_pandas()
+
+
+_output_converters: dict[str, typing.Callable[..., typing.Any]] = {
+    'polars': lambda result: result,
+    'pandas': _to_pandas,
+    'series': lambda result: result.to_series(),
+    'list': lambda result: result.to_dicts(),
+    'dict': lambda result: result.to_dict(as_series=False),
+}
+
+
+def _format_output(
+    result: pl.DataFrame,
+    output_format: _spec.PythonOutput,
+) -> pl.DataFrame | pl.Series | pd.DataFrame | pd.Series | ListOfDicts | DictOfLists:
+    """convert collected dataframe into requested output format"""
+
+    try:
+        converter = _output_converters[output_format]
+    except KeyError:
+        raise Exception('unknown output format')
+    return converter(result)
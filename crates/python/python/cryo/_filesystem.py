@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import functools
+import typing
+
+if typing.TYPE_CHECKING:
+    import polars as pl
+
+    from . import _spec
+
+
+def get_glob(
+    datatype: _spec.Datatype,
+    *,
+    network: str | int | None = None,
+    output_dir: str = '.',
+    file_format: _spec.FileFormat = 'parquet',
+) -> str:
+    """get glob pattern matching output files of datatype"""
+
+    if network is None:
+        network_name = '*'
+    elif isinstance(network, int):
+        network_name = _resolve_network_name(network)
+    else:
+        network_name = network
+
+    return _build_path_glob(network_name, datatype, output_dir, file_format)
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_network_name(network: int) -> str:
+    """resolve chain_id to network name, caching each mesc lookup"""
+
+    import mesc
+
+    network_name = mesc.network_names.network_names.get(str(network))
+    if network_name is None:
+        raise Exception('unknown network: ' + str(network))
+    return network_name
+
+
+@functools.lru_cache(maxsize=256)
+def _build_path_glob(
+    network_name: str,
+    datatype: str,
+    output_dir: str,
+    file_format: str,
+) -> str:
+    """build glob pattern for output files, caching each combination"""
+
+    file_glob = f'{network_name}__{datatype}__*.{file_format}'
+    if output_dir.endswith('/'):
+        return output_dir + file_glob
+    return f'{output_dir}/{file_glob}'
+
+
+def get_file_list(
+    datatype: _spec.Datatype,
+    *,
+    network: str | int | None = None,
+    output_dir: str = '.',
+    file_format: _spec.FileFormat = 'parquet',
+    start_block: int | None = None,
+    end_block: int | None = None,
+) -> list[str]:
+    """list output files of datatype, skipping files outside block range"""
+
+    import fnmatch
+    import os
+
+    path_glob = get_glob(
+        datatype,
+        network=network,
+        output_dir=output_dir,
+        file_format=file_format,
+    )
+    directory, file_pattern = os.path.split(path_glob)
+
+    # output_dir is a literal flat directory, so one scandir pass plus
+    # fnmatch beats glob's per-component pattern compilation and stats
+    try:
+        with os.scandir(directory) as entries:
+            names = fnmatch.filter((entry.name for entry in entries), file_pattern)
+    except FileNotFoundError:
+        return []
+
+    files: typing.Iterable[str] = (os.path.join(directory, name) for name in names)
+    if start_block is not None or end_block is not None:
+        # filter while streaming instead of materializing the full list first
+        files = (
+            file
+            for file in files
+            if _file_intersects_block_range(file, start_block, end_block)
+        )
+    return sorted(files)
+
+
+def _file_intersects_block_range(
+    path: str,
+    start_block: int | None,
+    end_block: int | None,
+) -> bool:
+    """return whether block range in filename intersects [start_block, end_block]"""
+
+    import re
+
+    match = re.search(r'__(\d+)_to_(\d+)', path)
+    if match is None:
+        return True
+    if start_block is not None and int(match.group(2)) < start_block:
+        return False
+    if end_block is not None and int(match.group(1)) > end_block:
+        return False
+    return True
+
+
+def scan(
+    datatype: _spec.Datatype,
+    *,
+    network: str | int | None = None,
+    output_dir: str = '.',
+    start_block: int | None = None,
+    end_block: int | None = None,
+) -> pl.LazyFrame:
+    """lazily scan parquet output files of datatype
+
+    files whose filename block range falls outside [start_block, end_block]
+    are pruned before polars opens them
+    """
+
+    import polars as pl
+
+    files = get_file_list(
+        datatype,
+        network=network,
+        output_dir=output_dir,
+        start_block=start_block,
+        end_block=end_block,
+    )
+    if len(files) == 0:
+        raise Exception('no files found for datatype ' + str(datatype))
+
+    lf = pl.scan_parquet(files)
+
+    # also filter block_number so polars can prune row groups using stats
+    if start_block is not None and end_block is not None:
+        lf = lf.filter(pl.col('block_number').is_between(start_block, end_block))
+    elif start_block is not None:
+        lf = lf.filter(pl.col('block_number') >= start_block)
+    elif end_block is not None:
+        lf = lf.filter(pl.col('block_number') <= end_block)
+
+    return lf
@@ -16,6 +16,7 @@ if typing.TYPE_CHECKING:
     PythonOutput = Union[
         Literal['polars'],
         Literal['pandas'],
+        Literal['series'],
         Literal['list'],
         Literal['dict'],
     ]
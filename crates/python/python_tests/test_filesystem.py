@@ -0,0 +1,107 @@
+import os
+import sys
+import tempfile
+import types
+
+import pytest
+
+import cryo
+from cryo import _filesystem
+
+
+filenames = [
+    'ethereum__blocks__17000000_to_17000999.parquet',
+    'ethereum__blocks__17001000_to_17001999.parquet',
+    'ethereum__blocks__17002000_to_17002999.parquet',
+    'ethereum__logs__17000000_to_17000999.parquet',
+    'ethereum__blocks__17000000_to_17000999.csv',
+]
+
+block_ranges = [
+    # (start_block, end_block, expected file block ranges)
+    (None, None, ['17000000_to_17000999', '17001000_to_17001999', '17002000_to_17002999']),
+    (17001000, None, ['17001000_to_17001999', '17002000_to_17002999']),
+    (None, 17000999, ['17000000_to_17000999']),
+    (17001500, 17001600, ['17001000_to_17001999']),
+    # boundaries are inclusive: a file ending at start_block still intersects
+    (17000999, None, ['17000000_to_17000999', '17001000_to_17001999', '17002000_to_17002999']),
+    # a file starting at end_block still intersects
+    (None, 17001000, ['17000000_to_17000999', '17001000_to_17001999']),
+    (17003000, None, []),
+]
+
+
+def make_output_dir():
+    output_dir = tempfile.mkdtemp()
+    for filename in filenames:
+        open(os.path.join(output_dir, filename), 'w').close()
+    return output_dir
+
+
+def test_get_glob():
+    assert cryo.get_glob('blocks') == './*__blocks__*.parquet'
+    glob = cryo.get_glob('logs', network='ethereum', output_dir='/data')
+    assert glob == '/data/ethereum__logs__*.parquet'
+    glob = cryo.get_glob('logs', network='ethereum', output_dir='/data/')
+    assert glob == '/data/ethereum__logs__*.parquet'
+    glob = cryo.get_glob('blocks', file_format='csv')
+    assert glob == './*__blocks__*.csv'
+
+
+def test_get_glob_int_network(monkeypatch):
+    fake_mesc = types.SimpleNamespace(
+        network_names=types.SimpleNamespace(network_names={'1': 'ethereum'}),
+    )
+    monkeypatch.setitem(sys.modules, 'mesc', fake_mesc)
+    _filesystem._resolve_network_name.cache_clear()
+    try:
+        glob = cryo.get_glob('blocks', network=1)
+        assert glob == './ethereum__blocks__*.parquet'
+        with pytest.raises(Exception):
+            cryo.get_glob('blocks', network=999999999)
+    finally:
+        _filesystem._resolve_network_name.cache_clear()
+
+
+@pytest.mark.parametrize('block_range', block_ranges)
+def test_get_file_list_block_pruning(block_range):
+    start_block, end_block, expected_ranges = block_range
+    output_dir = make_output_dir()
+    files = cryo.get_file_list(
+        'blocks',
+        network='ethereum',
+        output_dir=output_dir,
+        start_block=start_block,
+        end_block=end_block,
+    )
+    expected = sorted(
+        os.path.join(output_dir, 'ethereum__blocks__' + block_range + '.parquet')
+        for block_range in expected_ranges
+    )
+    assert files == expected
+
+
+def test_get_file_list_filters_datatype_and_format():
+    output_dir = make_output_dir()
+    files = cryo.get_file_list('logs', network='ethereum', output_dir=output_dir)
+    assert files == [os.path.join(output_dir, 'ethereum__logs__17000000_to_17000999.parquet')]
+    files = cryo.get_file_list(
+        'blocks', network='ethereum', output_dir=output_dir, file_format='csv'
+    )
+    assert files == [os.path.join(output_dir, 'ethereum__blocks__17000000_to_17000999.csv')]
+
+
+def test_get_file_list_missing_dir():
+    output_dir = os.path.join(tempfile.mkdtemp(), 'does_not_exist')
+    assert cryo.get_file_list('blocks', output_dir=output_dir) == []
+
+
+def test_file_intersects_block_range():
+    path = 'ethereum__blocks__17000000_to_17000999.parquet'
+    assert _filesystem._file_intersects_block_range(path, None, None)
+    assert _filesystem._file_intersects_block_range(path, 17000999, None)
+    assert not _filesystem._file_intersects_block_range(path, 17001000, None)
+    assert _filesystem._file_intersects_block_range(path, None, 17000000)
+    assert not _filesystem._file_intersects_block_range(path, None, 16999999)
+    # files without a block range in their name are never pruned
+    assert _filesystem._file_intersects_block_range('notes.txt', 17000000, 17000999)
@@ -0,0 +1,51 @@
+use pyo3::{
+    exceptions::PyTypeError,
+    prelude::*,
+    types::{PyAny, PyDict},
+};
+
+#[pyfunction(
+    signature = (
+        start_block = None,
+        end_block = None,
+        file_format = "parquet",
+        verbose = true,
+        **kwargs,
+    )
+)]
+pub fn parse_cli_args<'py>(
+    py: Python<'py>,
+    start_block: Option<&PyAny>,
+    end_block: Option<&PyAny>,
+    file_format: &str,
+    verbose: bool,
+    kwargs: Option<&'py PyDict>,
+) -> PyResult<&'py PyDict> {
+    let args = match kwargs {
+        Some(kwargs) => kwargs,
+        None => PyDict::new(py),
+    };
+
+    let blocks = match (start_block, end_block) {
+        (Some(start_block), Some(end_block)) => {
+            Some(format!("{}:{}", start_block.str()?, end_block.str()?))
+        }
+        (Some(start_block), None) => Some(format!("{}:", start_block.str()?)),
+        (None, Some(end_block)) => Some(format!(":{}", end_block.str()?)),
+        (None, None) => None,
+    };
+    if let Some(blocks) = blocks {
+        args.set_item("blocks", vec![blocks])?;
+    }
+
+    match file_format {
+        "parquet" => {}
+        "json" => args.set_item("json", true)?,
+        "csv" => args.set_item("csv", true)?,
+        _ => return Err(PyErr::new::<PyTypeError, _>("unknown file_format")),
+    }
+
+    args.set_item("no_verbose", !verbose)?;
+
+    Ok(args)
+}
@@ -1,3 +1,4 @@
+mod args_adapter;
 mod collect_adapter;
 mod freeze_adapter;
 
@@ -15,7 +16,11 @@ fn sum_as_string(a: usize, b: usize) -> PyResult<String> {
 #[pyo3(name = "_cryo_rust")]
 fn cryo_rust(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(sum_as_string, m)?)?;
+    m.add_function(wrap_pyfunction!(args_adapter::parse_cli_args, m)?)?;
     m.add_function(wrap_pyfunction!(freeze_adapter::_freeze, m)?)?;
+    m.add_function(wrap_pyfunction!(freeze_adapter::_freeze_blocking, m)?)?;
     m.add_function(wrap_pyfunction!(collect_adapter::_collect, m)?)?;
+    m.add_function(wrap_pyfunction!(collect_adapter::_collect_blocking, m)?)?;
+    m.add_function(wrap_pyfunction!(collect_adapter::_collect_many_blocking, m)?)?;
     Ok(())
 }